@@ -1,4 +1,5 @@
 import copy
+from typing import Iterable, Iterator
 from anytree import Node, RenderTree
 
 
@@ -135,6 +136,80 @@ def negation_normal_form(formula: str, show_tree=False) -> str:
     return collapse_tree(tree)
 
 
+# O(n) complexity -> One token traversal, no tree and no deep copies.
+# Every stack entry holds the positive and the negated NNF of a subformula
+# as nested tuples of tokens, so subformulas are shared instead of copied.
+def _stream_operands(stack: list, char: str, arity: int) -> list:
+    if len(stack) < arity:
+        raise ValueError(f"Invalid formula: missing operand for '{char}'")
+    operands = stack[-arity:]
+    del stack[-arity:]
+    return operands
+
+
+def _flatten(parts: tuple) -> Iterator[str]:
+    # Explicit stack: nesting grows with the formula, not the call depth
+    pending = [iter(parts)]
+    while pending:
+        for part in pending[-1]:
+            if isinstance(part, tuple):
+                pending.append(iter(part))
+                break
+            yield part
+        else:
+            pending.pop()
+
+
+def negation_normal_form_stream(tokens: Iterable[str]) -> Iterator[str]:
+    """Rewrites a formula in negation normal form, token by token.
+    Args:
+        tokens: An iterable of strings (a formula, a list of tokens or an
+            open text file); each character is a token, whitespace is ignored.
+    Raises:
+        TypeError: If a token is not a string.
+        ValueError: If the formula is invalid.
+    Returns:
+        An iterator over the tokens of the NNF formula.
+    """
+    stack = []
+    for chunk in tokens:
+        if not isinstance(chunk, str):
+            raise TypeError(f"Token must be a string, not {type(chunk)}")
+        for char in chunk:
+            if char.isspace():
+                continue
+            if char.isalpha() and char.isupper():
+                stack.append(((char,), (char, "!")))
+            elif char == '!':
+                (pos, neg), = _stream_operands(stack, char, 1)
+                stack.append((neg, pos))
+            elif char in "&|^>=":
+                (a_pos, a_neg), (b_pos, b_neg) = \
+                    _stream_operands(stack, char, 2)
+                if char == '&':
+                    pos = (a_pos, b_pos, "&")
+                    neg = (a_neg, b_neg, "|")
+                elif char == '|':
+                    pos = (a_pos, b_pos, "|")
+                    neg = (a_neg, b_neg, "&")
+                elif char == '>':
+                    pos = (a_neg, b_pos, "|")
+                    neg = (a_pos, b_neg, "&")
+                else:
+                    same = (a_pos, b_pos, "&", a_neg, b_neg, "&", "|")
+                    differ = (a_pos, b_neg, "&", a_neg, b_pos, "&", "|")
+                    pos, neg = (same, differ) if char == '=' \
+                        else (differ, same)
+                stack.append((pos, neg))
+            else:
+                raise ValueError(f"Invalid character '{char}' in formula")
+
+    if len(stack) != 1:
+        raise ValueError("Invalid formula: unbalanced operands")
+
+    return _flatten(stack[0][0])
+
+
 if __name__ == "__main__":
     print(negation_normal_form("AB&!", show_tree=True))
     print('*' * 25)
@@ -152,3 +227,9 @@ if __name__ == "__main__":
     assert negation_normal_form("AB>") == "A!B|"
     assert negation_normal_form("AB=") == "AB&A!B!&|"
     assert negation_normal_form("AB|C&!") == "A!B!&C!|"
+
+    for formula, expected in [("AB&!", "A!B!|"), ("AB|!", "A!B!&"),
+                              ("AB>", "A!B|"), ("AB=", "AB&A!B!&|"),
+                              ("AB|C&!", "A!B!&C!|")]:
+        assert "".join(negation_normal_form_stream(formula)) == expected
+        assert "".join(negation_normal_form_stream(iter(formula))) == expected